@@ -26,14 +26,52 @@ The game can be played by running this script directly or by importing the modul
 (or the Game and Keyboard classes) to another script.
 '''
 
-import enchant
-import requests as req
 import random
 import os.path
 from typing import Tuple, List
+import mmap
 import sys
 import json
 
+# Parsed contents of each words file, keyed by filename. Loading and parsing
+# the json file is by far the most expensive part of constructing a Game, so
+# it is done at most once per file per process.
+_WORDS_CACHE = {}
+
+# ANSI display attributes
+GREEN = '\033[92m'
+YELLOW = '\033[93m'
+BOLD = '\033[1m'
+END = '\033[0m'
+
+# colour names accepted by Keyboard.mark -> SGR prefix (9 = strikethrough)
+KEY_COLOURS = {'green': '\033[9;92m', 'yellow': '\033[9;93m', 'none': '\033[9m'}
+
+# canonical arrangement of the keyboard's letters; the rows never change, so
+# the only per-Keyboard state is which keys have been marked
+KB_ROWS = (('q', 'w', 'e', 'r', 't', 'y', 'u', 'i', 'o', 'p'),
+           ('a', 's', 'd', 'f', 'g', 'h', 'j', 'k', 'l'),
+           ('z', 'x', 'c', 'v', 'b', 'n', 'm'))
+
+# letter -> ready-made display cell for the results grid, built once at import
+# so evaluate doesn't re-concatenate ANSI codes for every matched letter
+# (the plain form of a letter is the letter itself)
+_GREEN_CELLS = {c: GREEN + BOLD + c.upper() + END for c in 'abcdefghijklmnopqrstuvwxyz'}
+_YELLOW_CELLS = {c: YELLOW + BOLD + c.upper() + END for c in 'abcdefghijklmnopqrstuvwxyz'}
+
+def letter_counts(word:str) -> bytes:
+    '''
+    Returns the letter counts of a word as a 26-byte table indexed by
+    ord(letter) - ord('a').
+
+    Parameters: word (str): the input string (lowercase letters only).
+    Returns: bytes.
+    '''
+    counts = bytearray(26)
+    for c in word:
+        counts[ord(c) - 97] += 1
+    return bytes(counts)
+
 def get_len_word() -> int:
     '''
     Prompts the user for the length of words (3 to 8) they want to play with.
@@ -58,35 +96,39 @@ class Keyboard:
     '''
     The Keyboard class
 
-    It contains a nested list "self.keys" containing all letters in the qwerty
-    keyboard arranged in three rows.
-
-    The "self.attributes" dictionary contains attribute codes that can be added
-    to the keys to visually aid the player.
+    The arrangement of the keys lives in the module-level KB_ROWS constant;
+    the only per-instance state is "self._marks", which maps each marked
+    letter to its ready-made struck-through display form.
     '''
 
+    # letter -> ready-made struck-through keycap, per colour
+    _STYLED = {colour: {c: prefix + c + END for row in KB_ROWS for c in row}
+               for colour, prefix in KEY_COLOURS.items()}
+
     def __init__(self):
-        self.keys = [['q', 'w', 'e', 'r', 't', 'y', 'u', 'i', 'o', 'p'],
-                    ['a', 's', 'd', 'f', 'g', 'h', 'j', 'k', 'l'],
-                    ['z', 'x', 'c', 'v', 'b', 'n', 'm']]
-
-        self.attributes = {'green':'\033[92m',
-              'yellow':'\033[93m',
-              'bold':'\033[1m',
-              'underline':'\033[4m',
-              'end':'\033[0m',
-              'none':'',
-              'strikethrough':'\u0336'}   # use strikethrough after string
+        self._marks = {}
+
+    def reset(self) -> None:
+        '''
+        Restores every key to its unmarked state.
+        '''
+        self._marks.clear()
+
+    def render(self) -> str:
+        '''
+        Returns the keyboard as printable text, substituting the marked form
+        of each marked key.
+        '''
+        # leading spaces match a real keyboard's arrangement
+        marks = self._marks
+        return "\n".join(i*" " + " ".join(marks.get(c, c) for c in row)
+                         for i, row in enumerate(KB_ROWS))
 
     def print(self) -> None:
         '''
-        Prints the keyboard.
+        Prints the keyboard with a single write to stdout.
         '''
-        for i, line in enumerate(self.keys):
-            print(i*" ", end="")             # spacing to match a real keyboard's arrangement
-            for key in line:
-                print(key, end=' ')
-            print("")
+        sys.stdout.write(self.render() + "\n")
 
     def mark(self, char:str, colour:str) -> None:
         '''
@@ -95,15 +137,12 @@ class Keyboard:
 
         Parameters:
             char (str): character(letter) to mark
-            colour (str): colour to mark with (green/yellow)
+            colour (str): colour to mark with (green/yellow/none)
         Returns:
             None
         '''
-        for i in range(len(self.keys)):
-            for j in range(len(self.keys[i])):
-                if self.keys[i][j][0] == char:
-                    if self.keys[i][j][0:2] != "\0":  # not already changed
-                        self.keys[i][j] = self.attributes[colour] + self.keys[i][j] + self.attributes['strikethrough'] + self.attributes['end']
+        if char not in self._marks:      # the first mark for a key wins
+            self._marks[char] = Keyboard._STYLED[colour][char]
 
 class Game:
     '''
@@ -118,14 +157,11 @@ class Game:
     self.len_word: Length of words in the game
     self.results: Contains results of each of the six guesses the user makes in
         a nested list.
-    self.words_list: A list containing a dictionary of five-letter words loaded
-        from a text file.
-    self.count: Number of words in the aforementioned list.
+    self._words: A memory-mapped packed index holding the sorted words of the
+        chosen length as contiguous fixed-width records. Loaded lazily on the
+        first call to play, so constructing a Game does no file work.
+    self.count: Number of words in the index.
     self.true_word: A randomly selected word to guess
-    self.true_word_dict: A dictionary object containing the counts of each letter
-        in self.true_word
-    self.dictionary: an object from theh "enchant" library that is used as a
-        spellchecker to validate each guess.
     '''
     def __init__(self, len_word):
         self.tries = 0
@@ -134,24 +170,28 @@ class Game:
         self.len_word = len_word
         self.results = [["_" for _ in range(len_word)] for _ in range(6)]
         self.kb = Keyboard()
-        self.attributes = {'green':'\033[92m',
-              'yellow':'\033[93m',
-              'bold':'\033[1m',
-              'underline':'\033[4m',
-              'end':'\033[0m',
-              'strikethrough':'\u0336'}   # use strikethrough after string
-
-        self.language = 'en_US'
-        self.words_list, self.count = self.load_dictionary2list('words_dict.txt', self.len_word)   # load dictionary of words of length self.len_word
-        self.true_word = self.words_list[random.randint(0, self.count-1)]              # word to guess
-        self.true_word_dict = self.word2dict(self.true_word)                       # dictionary containing letter counts of the word to guess
-        self.dictionary = enchant.Dict(self.language)                              # spellchecker
+
+        # prompt/error strings used on every guess, formatted once
+        self._prompt = 'Please enter a guess (' + str(len_word) + ' letters):  (or enter 0 to quit)'
+        self._len_msg = 'Guess must consist of ' + str(len_word) + ' letters'
+
+        # the word index is loaded (and the word to guess picked) lazily by
+        # _ensure_loaded, so the first prompt isn't blocked on file work
+        self._words = None
+        self.count = 0
+        self.true_word = None
+        self._true_counts = None
 
     def load_dictionary2list(self, filename:str, len_word:int) -> Tuple[List[str], int]:
         '''
         Reads a dictionary of words of desired length from a txt file (saved in
         json format) onto a list.
 
+        The file stores one list of words per length, indexed directly by
+        length (so entry 5 holds the five-letter words). The parsed file is
+        cached at module level, so constructing several Game objects (or
+        resetting a game) only reads and parses the file once.
+
         Parameters:
             filename (str): The method looks for this filename in the current
                 directory, which should store the words in json format.
@@ -163,33 +203,121 @@ class Game:
             value2: the length of this list.
         '''
 
-        try:
-            word_dict = json.load(open(filename))
-        except FileNotFoundError:
-            print("The file \"" + filename + "\" was not found in the current directory.")
-            sys.exit()
-        except:
-            print("Could not load json file from \"" + filename + "\". Please fix this and try again.")
-            sys.exit()
+        if filename not in _WORDS_CACHE:
+            try:
+                with open(filename, 'rb') as words_file:       # binary mode lets json decode in one pass
+                    _WORDS_CACHE[filename] = json.loads(words_file.read())
+            except FileNotFoundError:
+                print("The file \"" + filename + "\" was not found in the current directory.")
+                sys.exit()
 
-        words_list = word_dict[str(len_word)]      # json reads key as string
+        words_list = _WORDS_CACHE[filename][len_word]      # one bucket per length, indexed by length
 
         return words_list, len(words_list)
 
+    def load_word_index(self, filename:str, len_word:int) -> Tuple[mmap.mmap, int]:
+        '''
+        Memory-maps a packed index of words of the desired length, building it
+        from the json words file on first use.
+
+        The index file ("words_<n>.bin") holds the sorted words of length n as
+        contiguous fixed-width ascii records, so loading it is a single mmap
+        with no parsing and no per-word string objects, and membership tests
+        are a binary search over the records (see is_word). An index older
+        than the json words file is considered stale and rebuilt.
+
+        Parameters:
+            filename (str): The json words file used to build the index if it
+                doesn't exist yet.
+            len_word (int): Length of each word that should be in the index.
+
+        Returns:
+            Tuple(value1, value2):
+            value1: the memory-mapped index.
+            value2: the number of words in the index.
+        '''
+
+        index_name = 'words_' + str(len_word) + '.bin'
+        if (not os.path.exists(index_name)
+                or os.path.getmtime(index_name) < os.path.getmtime(filename)):
+            words_list, _ = self.load_dictionary2list(filename, len_word)
+            with open(index_name, 'wb') as index_file:
+                index_file.write(''.join(sorted(words_list)).encode('ascii'))
+
+        with open(index_name, 'rb') as index_file:
+            index = mmap.mmap(index_file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        return index, len(index) // len_word
+
+    def word_at(self, i:int) -> str:
+        '''
+        Returns the i-th word in the index.
+
+        Parameters: i (int): position of the word in the index.
+        Returns: str.
+        '''
+        n = self.len_word
+        return self._words[i*n:(i+1)*n].decode('ascii')
+
+    def is_word(self, guess:str) -> bool:
+        '''
+        Checks whether the guess appears in the word index, using a binary
+        search over the fixed-width records.
+
+        Parameters: guess (str): the word to look up.
+        Returns: bool.
+        '''
+        try:
+            target = guess.encode('ascii')
+        except UnicodeEncodeError:
+            return False
+
+        n = self.len_word
+        lo, hi = 0, self.count
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self._words[mid*n:(mid+1)*n] < target:
+                lo = mid + 1
+            else:
+                hi = mid
+        return lo < self.count and self._words[lo*n:(lo+1)*n] == target
+
+    def _new_word(self) -> None:
+        '''
+        Picks a new word to guess and precomputes its letter counts.
+        '''
+        self.true_word = self.word_at(random.randrange(self.count))
+        self._true_counts = letter_counts(self.true_word)
+
+    def _ensure_loaded(self) -> None:
+        '''
+        Loads the word index and picks the word to guess on first use.
+        '''
+        if self._words is None:
+            self._words, self.count = self.load_word_index('words_dict.txt', self.len_word)
+            self._new_word()
+
     def reset_game(self) -> None:
         '''
         Resets the game (by resetting class variables in the Game object) if the
         user wants to play again. Picks another word to guess.
+
+        The existing results grid and keyboard are reset in place rather than
+        reallocated.
         '''
 
         self.tries = 0
         self.found = False
         self.guess = None
-        self.results = [["_" for _ in range(self.len_word)] for _ in range(6)]
-        self.kb = Keyboard()
+        for row in self.results:
+            for i in range(len(row)):
+                row[i] = "_"
+        self.kb.reset()
 
-        self.true_word = self.words_list[random.randint(0, self.count-1)]              # word to guess
-        self.true_word_dict = self.word2dict(self.true_word)
+        if self._words is None:
+            self._ensure_loaded()              # also picks the new word to guess
+        else:
+            self._new_word()
 
     def play(self) -> None:
         '''
@@ -201,95 +329,88 @@ class Game:
         ensures that the input is a string of appropriate length which is a
         dictionary word.
 
-        If the guess isn't '0' (exit code), exact matches (correct letters in
-        correct positions) are checked for first. Then other matches (correct
-        letters in incorrect) positions are checked for.
-
-        This updates the self.results object which stores the guessed word in a
-        certain round, the keybard object and the self.true_word_dict variable
-        which stores the number of letters in the true word that haven't been
-        guessed yet.
+        If the guess isn't '0' (exit code), the guess is scored against the
+        true word by the evaluate method, which updates the self.results
+        object (which stores the guessed word in a certain round) and the
+        keyboard object, and reports whether the guess was fully correct.
 
         The updated results object and keyboard are also printed on the console.
 
-        In the end, the self.true_word_dict dictionary is reset for the next
-        guess.
+        If the guess matches the true word exactly, the game ends. If in six
+        tries, no correct guess has been made, the game ends.
+        '''
 
-        If the self.true_word_dict dictionary is empty after checking for exact
-        matches, then the user has made the correct guess. The game ends.
+        self._ensure_loaded()                  # first use loads the word index
 
-        If in six tries, no correct guess has been made, the game ends.
-        '''
+        self.render_frame()                    # draw the empty grid and keyboard
 
         while not self.found and self.tries < 6 and self.guess != '0':   # '0' is the code for terminating the program
 
             self.guess = self.get_guess()      # get a valid Guess
 
             if self.guess != '0':
-                self.check_exact_matches()     # exact matches are prioritised
-
-                if not self.true_word_dict:    # an empty dictionary at this point means all letters have been guessed correctly
-                    self.found = True
-                    print('Correct guess! Number of tries = ' + str(self.tries))
-
-                self.check_other_matches()     # other matches are checked for
-
-                self.print_results()           # printing results and the updated keyboard
-                self.kb.print()
-
+                self.found = self.evaluate()   # score the guess against the true word
                 self.tries += 1
 
-                self.true_word_dict = self.word2dict(self.true_word)      # reset true_word_dict
+                self.render_frame()            # repaint the grid and keyboard in place
+
+                if self.found:
+                    print('Correct guess! Number of tries = ' + str(self.tries))
 
         if self.guess == '0':
             print('QUIT')
         elif not self.found:
             print(':( The word was', self.true_word)
 
-    def check_exact_matches(self) -> None:
-        '''
-        Checks each letter in the guess for an exact match with the
-        true word. If there is a match, it updates the results and keyboard objects
-        to display the appropriate attributes (green colour and strikethrough
-        for the keyboard). It also updates the self.true_word_dict dicitonary using
-        another method which decrements the count of a certain letter in the
-        dicitonary object.
-        '''
-        for i in range(self.len_word):
-            if self.guess[i] == self.true_word[i]:
-                self.results[self.tries][i] = self.attributes['green'] + self.attributes['bold'] + self.guess[i].upper() + self.attributes['end']
-                self.kb.mark(self.guess[i], 'green')
-                self.update_true_word_dict(self.guess[i])         # update letter count for true word
-
-    def check_other_matches(self) -> None:
+    def evaluate(self) -> bool:
         '''
-        Checks for matches that are not in the correct positions (exact mathces
-        will have already been marked).
-
-        For each letter in the guess that doesn't have an exact match, if
-        the letter is still available in self.true_word_dict, it's marked
-        yellow in the results object and in the keybard (along with a
-        strikethrough). self.true_word_dict is also updated.
+        Scores the current guess against the true word in a single pass over
+        the word.
 
-        If the letter isn't available, it's still added to the results object
-        and marked with a strikethrough in the keyboard.
+        Exact matches (correct letters in correct positions) are marked green
+        first, each consuming its letter from a working copy of the true
+        word's precomputed letter counts. Each remaining position is then
+        marked yellow if its letter is still available in those counts
+        (decrementing the count), or left in the default colour otherwise.
+        The keyboard is marked to match.
 
+        Returns:
+            bool: True if every position matched exactly, False otherwise.
         '''
-        for i in range(self.len_word):
-            if self.results[self.tries][i] == "_":                    # an empty position means there is no exact match here
-                if self.guess[i] in self.true_word_dict:              # the letter is available
-                    self.results[self.tries][i] = self.attributes['yellow'] + self.attributes['bold'] + self.guess[i].upper() + self.attributes['end']
-                    self.kb.mark(self.guess[i], 'yellow')
-                    self.update_true_word_dict(self.guess[i])         # update letter count for true word
-
-                else:                                                 # the letter isn't available
-                    self.results[self.tries][i] = self.guess[i]
-                    self.kb.mark(self.guess[i], 'none')
+        # locals for everything touched inside the loops
+        guess = self.guess
+        row = self.results[self.tries]
+        mark = self.kb.mark
+        counts = bytearray(self._true_counts)                     # letters of the true word still unmatched
+        exact = 0
+        for i, (g, t) in enumerate(zip(guess, self.true_word)):
+            if g == t:
+                row[i] = _GREEN_CELLS[g]
+                mark(g, 'green')
+                counts[ord(g) - 97] -= 1                          # taken by the exact match
+                exact += 1
+
+        if exact == self.len_word:                                # correct guess - nothing left to mark
+            return True
+
+        for i, g in enumerate(guess):
+            if row[i] == "_":                                     # an empty position means there is no exact match here
+                o = ord(g) - 97
+                if counts[o] > 0:                                 # the letter is available
+                    row[i] = _YELLOW_CELLS[g]
+                    mark(g, 'yellow')
+                    counts[o] -= 1
+
+                else:                                             # the letter isn't available
+                    row[i] = g
+                    mark(g, 'none')
+
+        return False
 
     def get_guess(self) -> str:
         '''
         Prompts the user to enter a guess until it gets a word of appropriate
-        length which is validated by the dictionary.
+        length which appears in the loaded dictionary of words.
 
         Parameters: None.
         Returns:
@@ -298,57 +419,45 @@ class Game:
 
         guess = None
         while not guess:
-            guess = input('Please enter a guess (' + str(self.len_word) + ' letters):  (or enter 0 to quit)')
+            guess = input(self._prompt)
             if guess != '0':
                 if len(guess) != self.len_word:
-                    print('Guess must consist of ' + str(self.len_word) + ' letters')
+                    print(self._len_msg)
                     guess = None
-                elif not self.dictionary.check(guess):
+                elif not self.is_word(guess):
                     print('Word not recognised')
                     guess = None
         return guess
 
-    def word2dict(self, word:str) -> dict:
+    def render_frame(self) -> None:
         '''
-        Converts a string to a dictionary containing the counts of its characters.
+        Redraws the whole display (results grid and keyboard) as one frame,
+        with a single buffered write.
 
-        Parameters: word (str): the input string.
-        Returns: dict.
+        The cursor is homed and the screen cleared below it first, so each
+        round repaints the same screen region in place instead of scrolling
+        a fresh copy of the grid into the terminal.
         '''
-        output = dict()
-        for ch in word:
-            if ch in output:
-                output[ch] += 1
-            else:
-                output[ch] = 1
-        return output
+        sys.stdout.write("\033[H\033[J" + self.render_results() + "\n" + self.kb.render() + "\n")
+        sys.stdout.flush()
 
-    def update_true_word_dict(self, letter:str) -> None:
+    def render_results(self) -> str:
         '''
-        Decrements the count of the letter in self.true_word_dict. If the
-        original count is 1, the letter is popped from the dictionary.
-
-        Parameters: letter (str).
-        Returns: None.
+        Returns the results grid as printable text.
         '''
-        if self.true_word_dict[letter] == 1:      # update dict
-            self.true_word_dict.pop(letter)
-        else:
-            self.true_word_dict[letter] -= 1
+        return "\n".join(" ".join(line) for line in self.results)
 
     def print_results(self) -> None:
         '''
-        Prints results in a grid
+        Prints results in a grid, with a single write to stdout.
         '''
-        for line in self.results:
-            # print("     ", end="")
-            for ch in line:
-                print(ch, end=" ")
-            print("")
+        sys.stdout.write(self.render_results() + "\n")
 
 
 if __name__ == "__main__":
 
+    print('Welcome to WORDMASTER!')
+
     # create game object using length of words.
     len_word = get_len_word()
     this_game = Game(len_word)